@@ -86,8 +86,10 @@ class DiscordOrchestrator:
         while True:
             text = await self._queue.get()
             self._listening = False
-            reply = dialogue.respond(text)
-            message = getattr(reply, "narration", str(reply))
+            # dialogue.respond runs LLM inference and disk lookups; keep the
+            # event loop free to service audio and gateway traffic meanwhile.
+            reply = await asyncio.to_thread(dialogue.respond, text)
+            message = getattr(reply, "narration", reply)
             voice_name = self.profile.get("voice")
             voice = None
             if voice_name:
@@ -33,20 +33,34 @@ __all__ = [
 # Path to the JSON file storing profile information.
 PROFILES_FILE = Path(__file__).resolve().parents[1] / "data" / "discord_profiles.json"
 
+# Parsed profile data cached against the file's mtime. Profile lookups happen
+# per interaction, so re-reading and re-parsing the JSON each time is wasted
+# work when the file has not changed.
+_CACHE: tuple[int, Dict[str, Dict[str, Dict[str, Any]]]] | None = None
+
 
 def _load() -> Dict[str, Dict[str, Dict[str, Any]]]:
     """Load all profiles from :data:`PROFILES_FILE`."""
+    global _CACHE
     if PROFILES_FILE.exists():
         try:
-            return json.loads(PROFILES_FILE.read_text(encoding="utf-8"))
+            mtime = PROFILES_FILE.stat().st_mtime_ns
+            if _CACHE is not None and _CACHE[0] == mtime:
+                return _CACHE[1]
+            data = json.loads(PROFILES_FILE.read_text(encoding="utf-8"))
+            _CACHE = (mtime, data)
+            return data
         except Exception:
             return {}
+    _CACHE = None
     return {}
 
 
 def _save(data: Dict[str, Dict[str, Dict[str, Any]]]) -> None:
     """Persist ``data`` to :data:`PROFILES_FILE`."""
+    global _CACHE
     PROFILES_FILE.write_text(json.dumps(data, indent=2, sort_keys=True), encoding="utf-8")
+    _CACHE = None
 
 
 def get_profile(guild_id: int | str, channel_id: int | str) -> Dict[str, Any]:
@@ -3,10 +3,12 @@ from __future__ import annotations
 import asyncio
 import math
 import os
-from typing import Dict, List, Optional
+import sys
+from typing import Dict, FrozenSet, List, Optional
 import json
 import uuid
 from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
 import time
 
 import discord
@@ -24,20 +26,43 @@ try:
 except Exception:  # pragma: no cover - optional
     np = None  # type: ignore[assignment]
 
-try:
-    import resampy  # type: ignore
-except Exception:  # pragma: no cover - optional
-    resampy = None  # type: ignore[assignment]
+# Resampling backends are heavy (resampy pulls in numba); defer their import
+# to the first actual resample instead of paying for it at bot startup.
+resampy = None  # type: ignore[assignment]
+resample_poly = None  # type: ignore[assignment]
+_resample_backends_loaded = False
+
+
+def _load_resample_backends() -> None:
+    global resampy, resample_poly, _resample_backends_loaded
+    if _resample_backends_loaded:
+        return
+    _resample_backends_loaded = True
     try:
-        from scipy.signal import resample_poly  # type: ignore
+        import resampy as _resampy  # type: ignore
+        resampy = _resampy
     except Exception:  # pragma: no cover - optional
-        resample_poly = None  # type: ignore[assignment]
+        try:
+            from scipy.signal import resample_poly as _resample_poly  # type: ignore
+            resample_poly = _resample_poly
+        except Exception:  # pragma: no cover - optional
+            pass
 
 try:
     import soundfile as sf  # type: ignore
 except Exception:  # pragma: no cover - optional
     sf = None  # type: ignore[assignment]
 
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import uvloop  # type: ignore
+except Exception:  # pragma: no cover - optional
+    uvloop = None  # type: ignore[assignment]
+
 from config.discord_token import get_token
 from mouth.tts import TTSEngine
 
@@ -150,16 +175,35 @@ class SlashResponder:
         except Exception:
             await self.send_followup(*args, **kwargs)
 
-COMMAND_SUMMARIES = [
+COMMAND_SUMMARIES = (
     ("/ping", "Check if the bot is alive"),
     ("/join [channel]", "Join your voice channel or specified channel"),
     ("/leave", "Leave the current voice channel"),
     ("/say <text>", "Speak text in the connected voice channel"),
     ("/act", "Open UI to choose NPC + voice"),
-]
+    ("/commands", "List available Blossom commands"),
+)
+
+# Prebuilt command-list reply; the summaries are fixed at import time so the
+# message never needs to be re-joined per request.
+COMMANDS_MESSAGE = "\n".join(
+    ["Available Blossom commands:"]
+    + [f"{syntax} — {description}" for syntax, description in COMMAND_SUMMARIES]
+)
 
 DEFAULT_GREETING_PATH = os.path.join("assets", "scripted_sounds", "Discord_Recorded _Greeting.wav")
 GREETING_MIN_INTERVAL = 5.0  # seconds
+GREETING_LOAD_TIMEOUT = 10.0  # seconds
+TTS_SYNTH_TIMEOUT = 120.0  # seconds
+
+
+def _emit_act_event(req: dict) -> None:
+    """Write an act request to stdout for the UI without re-serializing via stdlib json."""
+    if orjson is not None:
+        sys.stdout.buffer.write(orjson.dumps({"discord_act": req}) + b"\n")
+        sys.stdout.buffer.flush()
+    else:
+        print(json.dumps({"discord_act": req}), flush=True)
 
 
 def ensure_opus_loaded() -> None:
@@ -185,9 +229,10 @@ def ensure_opus_loaded() -> None:
 def _resample_to_48k(audio: List[float] | 'np.ndarray', input_rate: int) -> List[float] | 'np.ndarray':
     if input_rate == 48000:
         return audio
+    _load_resample_backends()
     if np is not None and resampy is not None:
         return resampy.resample(audio, input_rate, 48000)
-    if np is not None and 'resample_poly' in globals() and resample_poly is not None:  # type: ignore[name-defined]
+    if np is not None and resample_poly is not None:
         g = math.gcd(input_rate, 48000)
         return resample_poly(audio, 48000 // g, input_rate // g)  # type: ignore[no-any-return]
     # naive fallback
@@ -197,7 +242,10 @@ def _resample_to_48k(audio: List[float] | 'np.ndarray', input_rate: int) -> List
 
 class SlashTTSBot(commands.Bot):
     def __init__(self) -> None:
-        intents = discord.Intents.default()
+        # The bot only needs guild metadata and voice state for slash
+        # commands + TTS; start from none() so message/member/presence
+        # events are never delivered or buffered.
+        intents = discord.Intents.none()
         intents.guilds = True
         intents.voice_states = True
         super().__init__(command_prefix="!", intents=intents)
@@ -207,9 +255,29 @@ class SlashTTSBot(commands.Bot):
         self.greeting_path = self._resolve_greeting_path()
         self.greeting_volume = self._resolve_greeting_volume()
         self._last_greeting: Dict[int, float] = {}
+        # Last (guild_id, channel_id) written to the status file
+        self._last_status: Optional[tuple] = None
+        # Last resolved (profile name, VoiceProfile) pair used by speak()
+        self._profile_cache: Optional[tuple] = None
+        # Default narrator profile resolved once so plain speak() calls
+        # hand the backend a ready profile instead of re-resolving it.
+        try:
+            self._narrator_profile = self.engine.registry.get_profile("narrator")
+        except Exception:
+            self._narrator_profile = None
         # Avoid clobbering discord.Client.voice_clients property
         self._guild_voice_map: Dict[int, discord.VoiceClient] = {}
         self.permissions = self._load_permissions()
+        # Commands with at least one channel/role restriction; everything
+        # else short-circuits _is_allowed without touching the interaction.
+        self._restricted = frozenset(
+            name
+            for name, cfg in self.permissions.items()
+            if cfg.get("channels") or cfg.get("roles")
+        )
+        # Time-bucketed cache of permission decisions keyed by
+        # (guild_id, channel_id, user_id, command, bucket); see _is_allowed.
+        self._permission_cache: Dict[tuple, bool] = {}
         # Current persona voice profile name (registry key)
         self.current_profile: str = ""
         print(f"[discord] Self-deafen on connect: {self.self_deaf}")
@@ -290,14 +358,27 @@ class SlashTTSBot(commands.Bot):
 
     def _write_status(self, guild_id: Optional[int], channel_id: Optional[int]) -> None:
         try:
+            state = (
+                int(guild_id) if guild_id else None,
+                int(channel_id) if channel_id else None,
+            )
+            # Only touch disk when the guild/channel pair actually changed;
+            # the timestamp alone is not worth a write.
+            if state == self._last_status:
+                return
             os.makedirs("data", exist_ok=True)
             payload = {
-                "guild_id": int(guild_id) if guild_id else None,
-                "channel_id": int(channel_id) if channel_id else None,
+                "guild_id": state[0],
+                "channel_id": state[1],
                 "updated_at": datetime.now(timezone.utc).isoformat(),
             }
-            with open(self._status_path(), "w", encoding="utf-8") as f:
+            path = self._status_path()
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
                 json.dump(payload, f)
+            # Atomic swap so the UI never observes a half-written file.
+            os.replace(tmp_path, path)
+            self._last_status = state
         except Exception:
             pass
 
@@ -527,7 +608,7 @@ class SlashTTSBot(commands.Bot):
             print(f"[discord] Greeting skipped: file not found ({resolved})", flush=True)
             return
         guild = getattr(vc, 'guild', None)
-        guild_id = getattr(guild, 'id', None) if guild else None
+        guild_id = guild.id if guild is not None else None
         if guild_id is not None and not force:
             last = self._last_greeting.get(int(guild_id))
             if last and time.time() - last < GREETING_MIN_INTERVAL:
@@ -536,7 +617,16 @@ class SlashTTSBot(commands.Bot):
                     f"[discord] Greeting skipped: recently played for guild {guild_id} (wait {remaining:.1f}s)"
                 )
                 return
-        audio, rate = self._load_greeting_audio(resolved)
+        # soundfile decode is blocking; keep it off the event loop, and
+        # bound it so a wedged decoder cannot hang the greeting forever.
+        try:
+            audio, rate = await asyncio.wait_for(
+                asyncio.to_thread(self._load_greeting_audio, resolved),
+                timeout=GREETING_LOAD_TIMEOUT,
+            )
+        except asyncio.TimeoutError:
+            print(f"[discord] Greeting skipped: audio load timed out ({resolved})", flush=True)
+            return
         if audio is None or rate <= 0:
             return
         print(
@@ -619,18 +709,21 @@ class SlashTTSBot(commands.Bot):
                 pass
             await asyncio.sleep(1.0)
 
-    def _load_permissions(self) -> Dict[str, Dict[str, List[int]]]:
+    def _load_permissions(self) -> Dict[str, Dict[str, FrozenSet[int]]]:
         """Load simple permissions from config/discord.yaml if present.
 
         Format:
           command:
             channels: [id, id]
             roles: [id, id]
+
+        Id collections are frozen at load time so later permission checks
+        are plain O(1) membership tests against immutable rules.
         """
         path = os.path.join("config", "discord.yaml")
         if not os.path.exists(path):
             return {}
-        perms: Dict[str, Dict[str, List[int]]] = {}
+        perms: Dict[str, Dict[str, FrozenSet[int]]] = {}
         try:
             with open(path, "r", encoding="utf-8") as f:
                 lines = f.read().splitlines()
@@ -645,7 +738,7 @@ class SlashTTSBot(commands.Bot):
                         continue
                     current = line[:-1].strip().strip('"')
                     if current:
-                        perms[current] = {"channels": [], "roles": []}
+                        perms[current] = {"channels": frozenset(), "roles": frozenset()}
                     continue
                 if current is None:
                     continue
@@ -665,28 +758,62 @@ class SlashTTSBot(commands.Bot):
                 except Exception:
                     ids = []
                 if key in ("channels", "roles"):
-                    perms[current][key] = ids
+                    perms[current][key] = frozenset(ids)
         except Exception:
             return {}
         return perms
 
     def _is_allowed(self, interaction: discord.Interaction, command_name: str) -> bool:
-        cfg = self.permissions.get(command_name)
-        if not cfg:
+        # The common deployment has no discord.yaml at all; skip even the
+        # per-command lookup in that case.
+        if command_name not in self._restricted:
             return True
-        channels = cfg.get("channels") or []
-        roles = cfg.get("roles") or []
+        cfg = self.permissions[command_name]
+        # Permission decisions are stable for a given guild/channel/user/
+        # command, so cache them for 30-second windows to skip repeated role
+        # enumeration on bursty command usage. The channel must be part of
+        # the key: _check_permissions enforces channel restrictions, so a
+        # decision made in one channel does not transfer to another.
+        key = (
+            getattr(interaction.guild, "id", None),
+            interaction.channel_id,
+            getattr(interaction.user, "id", None),
+            command_name,
+            int(time.monotonic() // 30),
+        )
+        cached = self._permission_cache.get(key)
+        if cached is not None:
+            return cached
+        allowed = self._check_permissions(interaction, cfg)
+        if len(self._permission_cache) >= 2048:
+            self._permission_cache.clear()
+        self._permission_cache[key] = allowed
+        return allowed
+
+    def _check_permissions(self, interaction: discord.Interaction, cfg: Dict[str, FrozenSet[int]]) -> bool:
+        channels = cfg.get("channels") or frozenset()
+        roles = cfg.get("roles") or frozenset()
         # channel restriction
         if channels and interaction.channel_id not in channels:
             return False
         # role restriction
         if roles and isinstance(interaction.user, discord.Member):
-            user_role_ids = {r.id for r in interaction.user.roles}
-            if user_role_ids.isdisjoint(roles):
+            # Probe the frozenset directly instead of materialising a set of
+            # the member's role ids; most members match on an early role.
+            if not any(r.id in roles for r in interaction.user.roles):
                 return False
         return True
 
     async def setup_hook(self) -> None:  # called before login
+        # Size the default executor explicitly: asyncio.to_thread runs the
+        # blocking TTS/audio work there and the interpreter default
+        # (min(32, cpus + 4)) can be tiny in containers.
+        try:
+            self.loop.set_default_executor(
+                ThreadPoolExecutor(max_workers=8, thread_name_prefix="blossom-io")
+            )
+        except Exception:
+            pass
         # Fast guild-scoped sync when DISCORD_GUILD_ID is provided
         guild_id = os.getenv("DISCORD_GUILD_ID")
         if app_commands is not None and hasattr(self, 'tree'):
@@ -694,18 +821,18 @@ class SlashTTSBot(commands.Bot):
                 try:
                     gid = discord.Object(id=int(guild_id))
                     await self.tree.sync(guild=gid)
+                    # Record the sync so on_ready does not repeat the same
+                    # REST round-trip for this guild.
+                    _synced_guilds.add(int(guild_id))
                     print(f"[discord] Synced commands to guild {guild_id}")
                 except Exception:
                     await self.tree.sync()
                     print("[discord] Fallback: global command sync requested")
             else:
-                # Global sync may take up to an hour; we'll also perform
-                # a per-guild sync in on_ready for immediate availability.
-                try:
-                    await self.tree.sync()
-                    print("[discord] Global command sync requested")
-                except Exception as e:
-                    print(f"[discord] Global sync failed: {e}")
+                # Global sync may take up to an hour and on_ready performs a
+                # per-guild sync for immediate availability anyway, so skip
+                # the redundant global round-trip here.
+                print("[discord] Deferring command sync to per-guild sync in on_ready")
             return
 
         # Pycord or other forks without app_commands: rely on sync_commands API
@@ -754,11 +881,11 @@ class SlashTTSBot(commands.Bot):
 
 
 
-        guild_id = getattr(interaction.guild, "id", None)
+        guild_id = interaction.guild.id if interaction.guild else None
 
-        channel_id = getattr(target, "id", None)
+        channel_id = target.id
 
-        user_id = getattr(interaction.user, "id", None)
+        user_id = interaction.user.id
 
         print(
 
@@ -850,9 +977,9 @@ class SlashTTSBot(commands.Bot):
 
             try:
 
-                gid = getattr(interaction.guild, "id", None)
+                gid = interaction.guild.id
 
-                cid = getattr(target, "id", None)
+                cid = target.id
 
                 self._write_status(gid, cid)
 
@@ -876,21 +1003,41 @@ class SlashTTSBot(commands.Bot):
 
             return
 
-        profile = None
+        profile = self._narrator_profile
 
-        try:
+        if self.current_profile:
 
-            if self.current_profile:
+            cached = self._profile_cache
 
-                profile = self.engine.registry.get_profile(self.current_profile)
+            if cached is not None and cached[0] == self.current_profile:
 
-        except Exception as exc:
+                profile = cached[1]
+
+            else:
+
+                try:
+
+                    profile = self.engine.registry.get_profile(self.current_profile)
+
+                    self._profile_cache = (self.current_profile, profile)
+
+                except Exception as exc:
+
+                    print(f"[discord] Failed to resolve persona profile '{self.current_profile}': {exc}")
+
+                    profile = None
+
+        # TTS synthesis is CPU-bound; run it in a worker thread so the
 
-            print(f"[discord] Failed to resolve persona profile '{self.current_profile}': {exc}")
+        # gateway heartbeat and other commands stay responsive.
 
-            profile = None
+        audio = await asyncio.wait_for(
 
-        audio = self.engine.synthesize(text, profile)
+            asyncio.to_thread(self.engine.synthesize, text, profile),
+
+            timeout=TTS_SYNTH_TIMEOUT,
+
+        )
 
         print(
 
@@ -904,6 +1051,13 @@ class SlashTTSBot(commands.Bot):
 
 bot = SlashTTSBot()
 
+# Resolved once at import time: whether the discord library exposes an
+# app_commands tree on this bot (discord.py) or not (py-cord forks).
+_HAS_COMMAND_TREE = app_commands is not None and hasattr(bot, 'tree')
+
+# Guilds whose slash commands were already synced this session.
+_synced_guilds: set[int] = set()
+
 
 @bot.event
 async def on_voice_state_update(
@@ -911,10 +1065,12 @@ async def on_voice_state_update(
     before: discord.VoiceState | None,
     after: discord.VoiceState | None,
 ) -> None:
+    # Voice state updates fire for every member in every connected guild;
+    # bail out immediately unless the update is about the bot itself.
+    user = bot.user
+    if user is None or member.id != user.id:
+        return
     try:
-        bot_id = getattr(bot.user, 'id', None)
-        if bot_id is None or getattr(member, 'id', None) != bot_id:
-            return
         before_channel = getattr(getattr(before, 'channel', None), 'id', None)
         after_channel = getattr(getattr(after, 'channel', None), 'id', None)
         self_deaf = getattr(after, 'self_deaf', None) if after else None
@@ -938,20 +1094,27 @@ async def on_ready() -> None:
     except Exception:
         pass
     try:
-        if app_commands is not None and hasattr(bot, 'tree'):
-            # Always perform per-guild sync for immediate availability
+        if _HAS_COMMAND_TREE:
+            # Per-guild sync gives immediate availability; skip guilds that
+            # were already synced this session (on_ready re-fires on resume).
             for g in bot.guilds:
+                if g.id in _synced_guilds:
+                    continue
                 try:
                     gid = discord.Object(id=g.id)
                     bot.tree.copy_global_to(guild=gid)
                     cmds = await bot.tree.sync(guild=gid)
+                    _synced_guilds.add(g.id)
                     print(f"[discord] Synced {len(cmds)} commands to guild {g.id} ({g.name})")
                 except Exception as e:
                     print(f"[discord] Guild sync failed for {getattr(g, 'id', '?')}: {e}")
         else:
             for g in bot.guilds:
+                if g.id in _synced_guilds:
+                    continue
                 try:
                     await bot.sync_commands(force=True, guild_ids=[g.id])
+                    _synced_guilds.add(g.id)
                     count = len(getattr(bot, 'application_commands', []) or [])
                     print(f"[discord] Synced {count} commands to guild {g.id} ({g.name})")
                 except Exception as e:
@@ -973,7 +1136,7 @@ async def _sync_command(target: object) -> None:
             await responder.send_message("Use this in a server.", ephemeral=True)
             return
         await _maybe_defer(target, ephemeral=True, thinking=True)
-        if app_commands is not None and hasattr(bot, 'tree'):
+        if _HAS_COMMAND_TREE:
             gid = discord.Object(id=interaction.guild.id)
             bot.tree.copy_global_to(guild=gid)
             cmds = await bot.tree.sync(guild=gid)
@@ -999,6 +1162,17 @@ async def _ping_command(target: object) -> None:
 
 
 
+async def _commands_command(target: object) -> None:
+    responder = SlashResponder(target)
+    interaction = responder.interaction
+    if not bot._is_allowed(interaction, "commands"):
+        await responder.send_message("You are not allowed to use this command here.", ephemeral=True)
+        return
+    await responder.send_message(COMMANDS_MESSAGE, ephemeral=True)
+
+
+
+
 async def _join_command(target: object, channel: Optional[discord.VoiceChannel]) -> None:
     responder = SlashResponder(target)
     interaction = responder.interaction
@@ -1031,7 +1205,7 @@ async def _leave_command(target: object) -> None:
         if interaction.guild:
             bot._set_guild_vc(interaction.guild, None)
         try:
-            gid = getattr(interaction.guild, 'id', None)
+            gid = interaction.guild.id if interaction.guild else None
             bot._write_status(gid, None)
         except Exception:
             pass
@@ -1085,6 +1259,9 @@ async def _takeover_command(target: object, profile: str) -> None:
         await responder.send_message("You are not allowed to use this command here.", ephemeral=True)
         return
     try:
+        # Joining voice (connect + greeting) can exceed the 3 s interaction
+        # window, so defer before starting the takeover.
+        await _maybe_defer(target, ephemeral=True, thinking=True)
         bot.current_profile = (profile or "").strip()
         vc = await bot.join(interaction, None)
         await responder.send_message(
@@ -1104,14 +1281,14 @@ async def _act_command(target: object) -> None:
         return
     try:
         req = {
-            "guild_id": getattr(interaction.guild, 'id', None),
-            "channel_id": getattr(interaction.channel, 'id', None),
-            "user_id": getattr(interaction.user, 'id', None),
-            "username": getattr(interaction.user, 'name', None),
+            "guild_id": interaction.guild.id if interaction.guild else None,
+            "channel_id": interaction.channel.id if interaction.channel else None,
+            "user_id": interaction.user.id,
+            "username": interaction.user.name,
             "request_id": str(uuid.uuid4()),
             "timestamp": datetime.now(timezone.utc).isoformat(),
         }
-        print(json.dumps({"discord_act": req}), flush=True)
+        _emit_act_event(req)
         await responder.send_message("Prompting the Blossom UI to select an NPC and voice...", ephemeral=True)
     except Exception as e:
         await responder.send_message(f"Act failed: {e}", ephemeral=True)
@@ -1119,7 +1296,7 @@ async def _act_command(target: object) -> None:
 
 
 
-        if app_commands is not None and hasattr(bot, 'tree'):
+        if _HAS_COMMAND_TREE:
             # Always perform per-guild sync for immediate availability
             for g in bot.guilds:
                 try:
@@ -1147,6 +1324,25 @@ async def _maybe_defer(
     ephemeral: bool | None = None,
     thinking: bool | None = None,
 ) -> None:
+    # Fast path: a bare discord.py Interaction that has not responded yet can
+    # be deferred directly without constructing a SlashResponder.
+    if isinstance(target, discord.Interaction):
+        response = getattr(target, "response", None)
+        if response is not None:
+            try:
+                if response.is_done():
+                    return
+                kwargs: dict[str, object] = {}
+                if ephemeral is not None:
+                    kwargs["ephemeral"] = ephemeral
+                if thinking is not None:
+                    kwargs["thinking"] = thinking
+                await response.defer(**kwargs)
+                return
+            except TypeError:
+                pass  # fall through to the variant-probing responder
+            except Exception:
+                return
     responder = SlashResponder(target)
     if responder.response_done():
         return
@@ -1175,7 +1371,7 @@ async def _sync_command(target: object) -> None:
 
         await _maybe_defer(target, ephemeral=True, thinking=True)
 
-        if app_commands is not None and hasattr(bot, 'tree'):
+        if _HAS_COMMAND_TREE:
 
             gid = discord.Object(id=interaction.guild.id)
 
@@ -1279,7 +1475,7 @@ async def _leave_command(target: object) -> None:
 
         try:
 
-            gid = getattr(interaction.guild, 'id', None)
+            gid = interaction.guild.id if interaction.guild else None
 
             bot._write_status(gid, None)
 
@@ -1375,6 +1571,12 @@ async def _takeover_command(target: object, profile: str) -> None:
 
     try:
 
+        # Joining voice (connect + greeting) can exceed the 3 s interaction
+
+        # window, so defer before starting the takeover.
+
+        await _maybe_defer(target, ephemeral=True, thinking=True)
+
         bot.current_profile = (profile or "").strip()
 
         vc = await bot.join(interaction, None)
@@ -1409,13 +1611,13 @@ async def _act_command(target: object) -> None:
 
         req = {
 
-            "guild_id": getattr(interaction.guild, 'id', None),
+            "guild_id": interaction.guild.id if interaction.guild else None,
 
-            "channel_id": getattr(interaction.channel, 'id', None),
+            "channel_id": interaction.channel.id if interaction.channel else None,
 
-            "user_id": getattr(interaction.user, 'id', None),
+            "user_id": interaction.user.id,
 
-            "username": getattr(interaction.user, 'name', None),
+            "username": interaction.user.name,
 
             "request_id": str(uuid.uuid4()),
 
@@ -1423,7 +1625,7 @@ async def _act_command(target: object) -> None:
 
         }
 
-        print(json.dumps({"discord_act": req}), flush=True)
+        _emit_act_event(req)
 
         await responder.send_message("Prompting the Blossom UI to select an NPC and voice...", ephemeral=True)
 
@@ -1435,7 +1637,7 @@ async def _act_command(target: object) -> None:
 
 
 
-        if app_commands is not None and hasattr(bot, 'tree'):
+        if _HAS_COMMAND_TREE:
             # Always perform per-guild sync for immediate availability
             for g in bot.guilds:
                 try:
@@ -1463,6 +1665,25 @@ async def _maybe_defer(
     ephemeral: bool | None = None,
     thinking: bool | None = None,
 ) -> None:
+    # Fast path: a bare discord.py Interaction that has not responded yet can
+    # be deferred directly without constructing a SlashResponder.
+    if isinstance(target, discord.Interaction):
+        response = getattr(target, "response", None)
+        if response is not None:
+            try:
+                if response.is_done():
+                    return
+                kwargs: dict[str, object] = {}
+                if ephemeral is not None:
+                    kwargs["ephemeral"] = ephemeral
+                if thinking is not None:
+                    kwargs["thinking"] = thinking
+                await response.defer(**kwargs)
+                return
+            except TypeError:
+                pass  # fall through to the variant-probing responder
+            except Exception:
+                return
     responder = SlashResponder(target)
     if responder.response_done():
         return
@@ -1491,7 +1712,7 @@ async def _sync_command(target: object) -> None:
 
         await _maybe_defer(target, ephemeral=True, thinking=True)
 
-        if app_commands is not None and hasattr(bot, 'tree'):
+        if _HAS_COMMAND_TREE:
 
             gid = discord.Object(id=interaction.guild.id)
 
@@ -1595,7 +1816,7 @@ async def _leave_command(target: object) -> None:
 
         try:
 
-            gid = getattr(interaction.guild, 'id', None)
+            gid = interaction.guild.id if interaction.guild else None
 
             bot._write_status(gid, None)
 
@@ -1691,6 +1912,12 @@ async def _takeover_command(target: object, profile: str) -> None:
 
     try:
 
+        # Joining voice (connect + greeting) can exceed the 3 s interaction
+
+        # window, so defer before starting the takeover.
+
+        await _maybe_defer(target, ephemeral=True, thinking=True)
+
         bot.current_profile = (profile or "").strip()
 
         vc = await bot.join(interaction, None)
@@ -1711,7 +1938,7 @@ async def _takeover_command(target: object, profile: str) -> None:
 
 
 
-if app_commands is not None and hasattr(bot, 'tree'):
+if _HAS_COMMAND_TREE:
 
     @bot.tree.command(description="Admin: Sync slash commands in this server")
     async def sync(interaction: discord.Interaction) -> None:
@@ -1749,6 +1976,10 @@ if app_commands is not None and hasattr(bot, 'tree'):
     async def act(interaction: discord.Interaction) -> None:
         await _act_command(interaction)
 
+    @bot.tree.command(name="commands", description="List available Blossom commands")
+    async def commands_list(interaction: discord.Interaction) -> None:
+        await _commands_command(interaction)
+
 else:
     if Option is None:
         raise RuntimeError("discord.Option is unavailable. Install py-cord>=2.4 to use slash commands.")
@@ -1802,16 +2033,25 @@ else:
     async def act(ctx: 'discord.ApplicationContext') -> None:
         await _act_command(ctx)
 
+    @bot.slash_command(name="commands", description="List available Blossom commands")
+    async def commands_list(ctx: 'discord.ApplicationContext') -> None:
+        await _commands_command(ctx)
+
 
 
 
 
 def main() -> None:
     token_env = os.getenv("DISCORD_TOKEN")
-    token = (token_env.strip() if isinstance(token_env, str) and token_env else None) or get_token()
-    token = token.strip() if isinstance(token, str) else None
+    raw = token_env if token_env and token_env.strip() else get_token()
+    token = raw.strip() if isinstance(raw, str) else None
     if not token:
         raise SystemExit("Set DISCORD_TOKEN or store a token via config.discord_token.set_token().")
+    if uvloop is not None:
+        # libuv's event loop cuts per-wakeup overhead for the gateway and
+        # voice sockets; fall back to the stock loop when unavailable.
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        print("[discord] Using uvloop event loop")
     try:
         print("[discord] Starting bot...")
         print(f"[discord] Token length: {len(token)} (source: {'env' if token_env else 'secrets.json'})")
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Dict, List
+from time import monotonic
+from typing import Any, Dict, List
 import json
 
 try:  # pragma: no cover - optional dependency
@@ -10,6 +11,21 @@ try:  # pragma: no cover - optional dependency
 except Exception:  # pragma: no cover - handled at runtime
     sd = None  # type: ignore[assignment]
 
+# Device enumeration walks PortAudio's host-API list on every call; the
+# hardware rarely changes mid-session, so cache the raw query briefly.
+DEVICE_CACHE_TTL = 5.0  # seconds
+_cache: tuple[float, Any] | None = None
+
+
+def _query_devices() -> Any:
+    global _cache
+    now = monotonic()
+    if _cache is not None and now - _cache[0] < DEVICE_CACHE_TTL:
+        return _cache[1]
+    devices = sd.query_devices()
+    _cache = (now, devices)
+    return devices
+
 
 def list_devices() -> Dict[str, List[Dict[str, object]]]:
     """Return available input and output audio devices.
@@ -22,15 +38,18 @@ def list_devices() -> Dict[str, List[Dict[str, object]]]:
     if sd is None:
         return {"input": [], "output": []}
 
-    devices = sd.query_devices()
+    devices = _query_devices()
     inputs: List[Dict[str, object]] = []
     outputs: List[Dict[str, object]] = []
+    add_input = inputs.append
+    add_output = outputs.append
     for idx, info in enumerate(devices):
-        name = info.get("name", f"Device {idx}")
-        if info.get("max_input_channels", 0) > 0:
-            inputs.append({"id": idx, "name": name})
-        if info.get("max_output_channels", 0) > 0:
-            outputs.append({"id": idx, "name": name})
+        get = info.get
+        name = get("name", f"Device {idx}")
+        if get("max_input_channels", 0) > 0:
+            add_input({"id": idx, "name": name})
+        if get("max_output_channels", 0) > 0:
+            add_output({"id": idx, "name": name})
     return {"input": inputs, "output": outputs}
 
 
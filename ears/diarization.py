@@ -39,7 +39,12 @@ def _load_pipeline() -> Pipeline:
         raise RuntimeError("pyannote.audio is required for diarization")
     # ``from_pretrained`` will download the model if necessary.  The
     # default model performs speaker diarization on short audio clips.
-    return Pipeline.from_pretrained("pyannote/speaker-diarization")
+    pipeline = Pipeline.from_pretrained("pyannote/speaker-diarization")
+    if torch is not None and torch.cuda.is_available():
+        # Inference on CPU is far from real time; move to the GPU when one
+        # is present.
+        pipeline.to(torch.device("cuda"))
+    return pipeline
 
 
 def pyannote_diarize(pcm: bytes) -> Iterable[Tuple[str, bytes]]:
@@ -55,8 +60,12 @@ def pyannote_diarize(pcm: bytes) -> Iterable[Tuple[str, bytes]]:
     sample_rate = 16000
     pipeline = _load_pipeline()
 
-    # Convert PCM bytes to the ``pyannote.audio`` expected format.
-    waveform = np.frombuffer(pcm, dtype=np.int16).astype(np.float32) / 32768.0
+    # Convert PCM bytes to the ``pyannote.audio`` expected format. The
+    # scale is applied in place so the multi-MB buffer is only written once
+    # instead of allocating a second float32 copy for the division.
+    samples = np.frombuffer(pcm, dtype=np.int16)
+    waveform = samples.astype(np.float32)
+    waveform /= 32768.0
     tensor = torch.from_numpy(waveform).unsqueeze(0)
     audio = {"waveform": tensor, "sample_rate": sample_rate}
     diarization = pipeline(audio)
@@ -64,8 +73,9 @@ def pyannote_diarize(pcm: bytes) -> Iterable[Tuple[str, bytes]]:
     for segment, _, speaker in diarization.itertracks(yield_label=True):
         start = int(segment.start * sample_rate)
         end = int(segment.end * sample_rate)
-        portion = waveform[start:end]
-        yield speaker, (portion * 32768.0).astype(np.int16).tobytes()
+        # Slice the original int16 samples rather than rescaling the float
+        # waveform back; the source PCM is already in memory.
+        yield speaker, samples[start:end].tobytes()
 
 
 __all__ = ["DiarizationHook", "pyannote_diarize"]
@@ -10,7 +10,7 @@ resamples these frames to 16 kHz mono.
 from __future__ import annotations
 
 import asyncio
-import inspect
+from collections import deque
 from typing import Awaitable, Callable, Optional
 
 import discord
@@ -24,23 +24,87 @@ SpeakingCallback = Callable[[discord.Member, bool], Awaitable[None]]
 
 
 class _PCMStream(discord.sinks.Sink):
-    """Sink that forwards PCM frames to a coroutine callback."""
+    """Sink that forwards PCM frames to a coroutine callback.
+
+    ``write`` runs on discord's voice receive thread. Instead of spawning a
+    task per 20 ms frame, frames are pushed onto a bounded single-producer/
+    single-consumer deque and a long-lived consumer coroutine on the event
+    loop drains it. Under backpressure the oldest frames are dropped rather
+    than stalling the receive thread.
+    """
+
+    #: Maximum buffered frames (~5 s of audio per speaker mix at 50 Hz).
+    RING_SIZE = 256
 
     def __init__(self, frame_callback: PCMFrameCallback):
         super().__init__()
         self._cb = frame_callback
+        # Classify the callback once at registration; probing each returned
+        # value with inspect.iscoroutine per frame is wasted work.
+        self._cb_is_coro = asyncio.iscoroutinefunction(frame_callback)
+        self._frames: deque = deque(maxlen=self.RING_SIZE)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._consumer: Optional[asyncio.Task] = None
+
+    def attach_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Bind the event loop and start the consumer coroutine."""
+
+        if self._consumer is not None:
+            return
+        self._loop = loop
+        self._wakeup = asyncio.Event()
+        self._consumer = loop.create_task(self._drain())
 
     @discord.sinks.Filters.container
     def write(self, data: bytes, user: discord.Member) -> None:  # type: ignore[override]
         if self._cb is None:
             return
-        result = self._cb(user, data)
-        if inspect.iscoroutine(result):
-            asyncio.create_task(result)
+        self._frames.append((user, data))
+        loop = self._loop
+        if loop is not None:
+            # The loop reference was captured once at attach time; only pay
+            # the cross-thread call when the consumer may actually be parked
+            # (the event reads as a plain bool, safe from this thread).
+            if not self._wakeup.is_set():
+                loop.call_soon_threadsafe(self._wakeup.set)
+        else:
+            # No loop attached (e.g. direct use in tests): fall back to
+            # inline dispatch.
+            result = self._cb(user, data)
+            if self._cb_is_coro:
+                asyncio.create_task(result)
+            self._frames.clear()
+
+    async def _drain(self) -> None:
+        frames = self._frames
+        while self._cb is not None:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            while frames:
+                user, data = frames.popleft()
+                cb = self._cb
+                if cb is None:
+                    return
+                result = cb(user, data)
+                if self._cb_is_coro:
+                    await result
 
     def cleanup(self) -> None:
         self.finished = True
         self._cb = None
+        consumer = self._consumer
+        if consumer is not None:
+            self._consumer = None
+            # cleanup() runs on discord's voice receive thread and
+            # Task.cancel is not thread-safe; hop onto the loop the same way
+            # the wakeup path does.
+            try:
+                self._loop.call_soon_threadsafe(consumer.cancel)
+            except RuntimeError:
+                # Loop already closed; the task died with it.
+                pass
+        self._frames.clear()
 
     def format_audio(self, audio) -> None:  # type: ignore[override]
         return
@@ -77,7 +141,9 @@ class DiscordListener(discord.Client):
         self._frame_cb = frame_callback
         self._voice_state_cb = on_voice_state_update
         self._speaking_cb = on_speaking
-        self._sink = _PCMStream(self._handle_frame)
+        # Hand the callback to the sink directly; a forwarding method here
+        # would cost an extra bound-method call per frame.
+        self._sink = _PCMStream(frame_callback)
 
     def _on_recording_finished(self, sink: discord.sinks.Sink, *args) -> None:
         return
@@ -86,6 +152,7 @@ class DiscordListener(discord.Client):
         """Connect to ``channel`` and begin capturing audio."""
 
         vc = await channel.connect()
+        self._sink.attach_loop(asyncio.get_running_loop())
         vc.start_recording(self._sink, self._on_recording_finished)
         return vc
 
@@ -100,10 +167,3 @@ class DiscordListener(discord.Client):
         if self._speaking_cb is not None:
             await self._speaking_cb(member, speaking)
 
-    # ------------------------------------------------------------------
-    # Internal helpers
-    # ------------------------------------------------------------------
-    def _handle_frame(self, user: discord.Member, data: bytes) -> Awaitable[None] | None:
-        if self._frame_cb is None:
-            return None
-        return self._frame_cb(user, data)
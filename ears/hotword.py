@@ -10,8 +10,14 @@ from __future__ import annotations
 
 from pathlib import Path
 import json
+import os
 from typing import Dict
 
+try:  # pragma: no cover - optional dependency
+    import orjson
+except Exception:  # pragma: no cover - handled at runtime
+    orjson = None  # type: ignore[assignment]
+
 # Directory where custom hotword models are stored.  Users may drop model
 # files (for example ``.tflite`` or ``.ppn``) in here and they will be
 # discovered automatically.
@@ -20,37 +26,68 @@ HOTWORD_DIR = Path(__file__).with_name("hotwords")
 CONFIG_FILE = HOTWORD_DIR / "hotwords.json"
 
 
+# Parsed configuration cached against the file's mtime. list_hotwords is
+# polled by the UI and queried at pipeline startup, so skip re-reading and
+# re-parsing the JSON while the file is unchanged.
+_CONFIG_CACHE: tuple[int, Dict[str, bool]] | None = None
+
+
 def _load_config() -> Dict[str, bool]:
     """Return the persisted hotword configuration."""
+    global _CONFIG_CACHE
     if CONFIG_FILE.exists():
         try:
-            data = json.loads(CONFIG_FILE.read_text("utf-8"))
+            mtime = CONFIG_FILE.stat().st_mtime_ns
+            if _CONFIG_CACHE is not None and _CONFIG_CACHE[0] == mtime:
+                return dict(_CONFIG_CACHE[1])
+            if orjson is not None:
+                data = orjson.loads(CONFIG_FILE.read_bytes())
+            else:
+                data = json.loads(CONFIG_FILE.read_text("utf-8"))
             if isinstance(data, dict):
                 # ensure bool values
-                return {str(k): bool(v) for k, v in data.items()}
+                cfg = {str(k): bool(v) for k, v in data.items()}
+                _CONFIG_CACHE = (mtime, dict(cfg))
+                return cfg
         except Exception:
             pass
+    _CONFIG_CACHE = None
     return {}
 
 
 def _save_config(cfg: Dict[str, bool]) -> None:
+    global _CONFIG_CACHE
     HOTWORD_DIR.mkdir(parents=True, exist_ok=True)
-    CONFIG_FILE.write_text(json.dumps(cfg, indent=2), encoding="utf-8")
+    if orjson is not None:
+        CONFIG_FILE.write_bytes(orjson.dumps(cfg, option=orjson.OPT_INDENT_2))
+    else:
+        CONFIG_FILE.write_text(json.dumps(cfg, indent=2), encoding="utf-8")
+    _CONFIG_CACHE = None
 
 
 def _discover_models(cfg: Dict[str, bool]) -> Dict[str, bool]:
     """Ensure configuration contains an entry for every model file."""
-    if HOTWORD_DIR.exists():
-        for path in HOTWORD_DIR.iterdir():
-            if path.is_file() and path.name != CONFIG_FILE.name:
-                cfg.setdefault(path.stem, False)
+    # os.scandir surfaces the file type from the directory entry itself,
+    # avoiding the extra stat per file that Path.iterdir + is_file incurs.
+    try:
+        entries = os.scandir(HOTWORD_DIR)
+    except OSError:
+        return cfg
+    with entries:
+        for entry in entries:
+            if entry.is_file() and entry.name != CONFIG_FILE.name:
+                cfg.setdefault(Path(entry.name).stem, False)
     return cfg
 
 
 def list_hotwords() -> Dict[str, bool]:
     """Return a mapping of available hotword models to enabled state."""
-    cfg = _discover_models(_load_config())
-    _save_config(cfg)
+    cfg_before = _load_config()
+    cfg = _discover_models(dict(cfg_before))
+    # Only persist when discovery actually added a model; the common case is
+    # a no-op and skipping the write avoids mkdir/dump/write_text per call.
+    if cfg != cfg_before:
+        _save_config(cfg)
     return cfg
 
 
@@ -1,13 +1,49 @@
 from __future__ import annotations
 
 import json
+import logging
 import os
 import threading
 import time
+import weakref
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, Iterable, Optional
 
+try:  # pragma: no cover - optional dependency
+    import orjson
+except Exception:  # pragma: no cover - handled at runtime
+    orjson = None  # type: ignore[assignment]
+
+
+def _flush_worker(logger_ref: "weakref.ref[TranscriptLogger]") -> None:
+    """Background flush loop for a single logger.
+
+    Only a weak reference is held between passes, so an abandoned logger can
+    be garbage-collected — ending its thread — rather than being pinned
+    forever by the bound-method target; :meth:`TranscriptLogger.close` ends
+    the loop explicitly.
+    """
+
+    while True:
+        logger = logger_ref()
+        if logger is None:
+            return
+        stopping = logger._stop.is_set()
+        with logger._pending_cv:
+            if not logger._pending and not stopping:
+                logger._pending_cv.wait(timeout=logger.FLUSH_INTERVAL)
+        try:
+            logger._drain()
+        except Exception:  # pragma: no cover - disk errors
+            # A transient I/O failure must not kill the flush thread;
+            # _drain requeued whatever it could not write, so the next
+            # pass retries.
+            logging.exception("Transcript flush failed")
+        if stopping:
+            return
+        del logger
+
 
 class TranscriptLogger:
     """Append and rotate per-channel transcript logs.
@@ -19,11 +55,41 @@ class TranscriptLogger:
         JSONL format with one entry per line.
     """
 
+    #: Seconds the background writer waits before flushing a partial batch.
+    FLUSH_INTERVAL = 0.2
+    #: Pending records per channel that trigger an immediate flush.
+    MAX_PENDING = 64
+
+    #: Live loggers, so readers can drain buffers held by other instances
+    #: writing to the same directory (e.g. session export constructs its own
+    #: logger while the pipeline's long-lived one still has entries pending).
+    _instances: "weakref.WeakSet[TranscriptLogger]" = weakref.WeakSet()
+
     def __init__(self, root: str | Path) -> None:
         self.root = Path(root)
         self.root.mkdir(parents=True, exist_ok=True)
+        TranscriptLogger._instances.add(self)
         self._locks: Dict[str, threading.Lock] = {}
+        # Append-mode file descriptors kept open per channel; opening and
+        # closing the log for every entry costs three syscalls per line.
+        self._fds: Dict[str, int] = {}
         self._session = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")
+        # Records are buffered per channel and flushed in batches by a
+        # background thread (or synchronously before reads), so bursts of
+        # short Whisper segments share one writev instead of a syscall each.
+        self._pending: Dict[str, list] = {}
+        self._pending_cv = threading.Condition()
+        self._io_lock = threading.Lock()
+        self._stop = threading.Event()
+        # The worker gets a weak reference so this instance stays
+        # collectable; see _flush_worker.
+        self._writer = threading.Thread(
+            target=_flush_worker,
+            args=(weakref.ref(self),),
+            name="transcript-flush",
+            daemon=True,
+        )
+        self._writer.start()
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -38,6 +104,94 @@ class TranscriptLogger:
     def _base_path(self, channel: str) -> Path:
         return self.root / f"{channel}.jsonl"
 
+    def _fd(self, channel: str) -> int:
+        """Return the cached append descriptor for ``channel``."""
+
+        fd = self._fds.get(channel)
+        if fd is None:
+            fd = os.open(
+                self._base_path(channel), os.O_WRONLY | os.O_APPEND | os.O_CREAT
+            )
+            self._fds[channel] = fd
+        return fd
+
+    def _drain(self) -> None:
+        """Write out all buffered records in arrival order."""
+
+        with self._pending_cv:
+            batches = self._pending
+            self._pending = {}
+            if not batches:
+                return
+            # Taken while still holding the condition so concurrent drains
+            # write their batches in the order they were collected.
+            self._io_lock.acquire()
+        try:
+            for channel in list(batches):
+                records = batches[channel]
+                with self._lock(channel):
+                    fd = self._fd(channel)
+                    if hasattr(os, "writev"):
+                        os.writev(fd, records)
+                    else:  # pragma: no cover - Windows fallback
+                        os.write(fd, b"".join(records))
+                del batches[channel]
+        except BaseException:
+            # Requeue everything unwritten (ahead of any newer records) so a
+            # failed pass delays entries instead of dropping them.
+            with self._pending_cv:
+                for channel, records in batches.items():
+                    records.extend(self._pending.get(channel, ()))
+                    self._pending[channel] = records
+            raise
+        finally:
+            self._io_lock.release()
+
+    def _siblings(self) -> list["TranscriptLogger"]:
+        """Return live loggers (including this one) writing to this root."""
+
+        return [lg for lg in TranscriptLogger._instances if lg.root == self.root]
+
+    def flush(self) -> None:
+        """Synchronously persist any buffered transcript records.
+
+        Buffers held by other live loggers on the same directory are drained
+        too, so a freshly constructed reader observes entries appended
+        through a long-lived writer instance.
+        """
+
+        for logger in self._siblings():
+            logger._drain()
+
+    def close(self) -> None:
+        """Flush pending records, stop the writer thread and release fds.
+
+        Safe to call more than once; the logger should not be used for new
+        appends afterwards. Short-lived loggers (e.g. per-export readers)
+        must call this so they do not accumulate flush threads.
+        """
+
+        self._stop.set()
+        with self._pending_cv:
+            self._pending_cv.notify()
+        self._writer.join(timeout=2 * self.FLUSH_INTERVAL + 1.0)
+        self._drain()
+        self._close_fds()
+        TranscriptLogger._instances.discard(self)
+
+    def _close_fds(self) -> None:
+        # Taken under the same locks the drain path writes with, so a
+        # descriptor is never closed (and potentially reused) between another
+        # thread's _fd() lookup and its writev.
+        with self._io_lock:
+            for channel, fd in list(self._fds.items()):
+                with self._lock(channel):
+                    try:
+                        os.close(fd)
+                    except OSError:
+                        pass
+            self._fds.clear()
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
@@ -53,9 +207,10 @@ class TranscriptLogger:
     ) -> None:
         """Append a transcript entry for ``channel``.
 
-        Each entry is written atomically to avoid interleaving between
-        concurrent writers. The log line is encoded as JSON and flushed using
-        the ``O_APPEND`` flag so writes are always appended.
+        Entries are buffered and written in batches by a background thread;
+        :meth:`flush`, :meth:`entries`, :meth:`summary` and :meth:`rotate`
+        persist anything still pending. Lines are JSON encoded and written
+        with the ``O_APPEND`` flag so concurrent writers never interleave.
 
         Parameters
         ----------
@@ -79,14 +234,15 @@ class TranscriptLogger:
             entry["language"] = language
         if confidence is not None:
             entry["confidence"] = confidence
-        data = json.dumps(entry, ensure_ascii=False) + "\n"
-        path = self._base_path(channel)
-        with self._lock(channel):
-            fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT)
-            try:
-                os.write(fd, data.encode("utf-8"))
-            finally:
-                os.close(fd)
+        if orjson is not None:
+            data = orjson.dumps(entry) + b"\n"
+        else:
+            data = json.dumps(entry, ensure_ascii=False).encode("utf-8") + b"\n"
+        with self._pending_cv:
+            pending = self._pending.setdefault(channel, [])
+            pending.append(data)
+            if len(pending) >= self.MAX_PENDING:
+                self._pending_cv.notify()
 
     def rotate(self) -> str:
         """Rotate existing channel logs into a session‑named file.
@@ -96,6 +252,13 @@ class TranscriptLogger:
         """
 
         session_id = self._session
+        # Persist buffered records — including those of other live loggers on
+        # this root — then release every cached descriptor so the rename
+        # below is safe and later appends reopen fresh base files rather
+        # than writing into the rotated ones.
+        for logger in self._siblings():
+            logger._drain()
+            logger._close_fds()
         for file in self.root.glob("*.jsonl"):
             rotated = file.with_name(f"{file.stem}.{session_id}{file.suffix}")
             file.replace(rotated)
@@ -108,18 +271,37 @@ class TranscriptLogger:
         return self.root / f"{channel}.{session_id}.jsonl"
 
     def entries(self, channel: str, session_id: Optional[str] = None) -> Iterable[dict]:
-        """Iterate transcript entries for ``channel`` and ``session_id``."""
+        """Iterate transcript entries for ``channel`` and ``session_id``.
+
+        Entries are streamed lazily so multi-hour logs never need to be
+        resident in memory at once.
+        """
 
+        self.flush()
         path = self._session_path(channel, session_id)
         if not path.exists():
-            return []
-        with open(path, encoding="utf-8") as fh:
-            return [json.loads(line) for line in fh if line.strip()]
+            return
+        loads = orjson.loads if orjson is not None else json.loads
+        with open(path, "rb") as fh:
+            for line in fh:
+                if line.strip():
+                    yield loads(line)
 
     def summary(self, channel: str, session_id: Optional[str] = None) -> str:
-        """Return a human‑readable summary for ``channel``."""
+        """Return a human‑readable summary for ``channel``.
 
-        return "\n".join(f"{e['speaker']}: {e['text']}" for e in self.entries(channel, session_id))
+        The whole log is slurped as bytes and split on newlines rather than
+        iterated line by line: a summary needs every entry anyway, and this
+        skips the per-line str decode the text iterator would pay.
+        """
+
+        self.flush()
+        path = self._session_path(channel, session_id)
+        if not path.exists():
+            return ""
+        loads = orjson.loads if orjson is not None else json.loads
+        entries = (loads(line) for line in path.read_bytes().split(b"\n") if line.strip())
+        return "\n".join(f"{e['speaker']}: {e['text']}" for e in entries)
 
 
 __all__ = ["TranscriptLogger"]
@@ -13,7 +13,7 @@ segment into per-speaker portions (e.g., using ``pyannote.audio``).
 from __future__ import annotations
 
 from collections import deque
-from typing import Awaitable, Callable, Deque, Dict, Iterable, List, Optional, Tuple
+from typing import Awaitable, Callable, Deque, Dict, Iterable, Optional, Tuple
 
 import webrtcvad
 
@@ -31,7 +31,12 @@ class _StreamState:
 
     def __init__(self, padding_frames: int) -> None:
         self.triggered = False
-        self.frames: List[bytes] = []
+        # Flat accumulation buffer; appending 640 B slices into one bytearray
+        # avoids the list-of-bytes bookkeeping and the O(segment) join copy
+        # that emitting used to pay.
+        self.buffer = bytearray()
+        # Size of the most recent frame, used to trim trailing padding.
+        self.frame_len = 0
         self.silence = 0
         self.pre_speech: Deque[bytes] = deque(maxlen=padding_frames)
         self.padding_frames = padding_frames
@@ -76,14 +81,16 @@ class VoiceActivityDetector:
         state = self._states.setdefault(speaker if self._diarizer else None, _StreamState(self._padding_frames))
         is_speech = self.vad.is_speech(frame, self.sample_rate)
 
+        state.frame_len = len(frame)
         if not state.triggered:
             state.pre_speech.append(frame)
             if is_speech:
                 state.triggered = True
-                state.frames.extend(state.pre_speech)
+                for pre in state.pre_speech:
+                    state.buffer += pre
                 state.pre_speech.clear()
         else:
-            state.frames.append(frame)
+            state.buffer += frame
             if is_speech:
                 state.silence = 0
             else:
@@ -91,11 +98,45 @@ class VoiceActivityDetector:
                 if state.silence > state.padding_frames:
                     await self._emit(state, speaker)
 
+    async def process_chunk(self, pcm: bytes, speaker: Optional[str] = None) -> None:
+        """Run the state machine over a multi-frame chunk of PCM.
+
+        Equivalent to calling :meth:`process` for each ``frame_ms`` slice of
+        ``pcm`` but with the speaker state, VAD binding and await points paid
+        once per chunk instead of once per 20 ms frame.
+        """
+
+        state = self._states.setdefault(
+            speaker if self._diarizer else None, _StreamState(self._padding_frames)
+        )
+        frame_bytes = self.sample_rate * self.frame_ms // 1000 * 2
+        is_speech_fn = self.vad.is_speech
+        sample_rate = self.sample_rate
+        for off in range(0, len(pcm), frame_bytes):
+            frame = pcm[off : off + frame_bytes]
+            is_speech = is_speech_fn(frame, sample_rate)
+            state.frame_len = len(frame)
+            if not state.triggered:
+                state.pre_speech.append(frame)
+                if is_speech:
+                    state.triggered = True
+                    for pre in state.pre_speech:
+                        state.buffer += pre
+                    state.pre_speech.clear()
+            else:
+                state.buffer += frame
+                if is_speech:
+                    state.silence = 0
+                else:
+                    state.silence += 1
+                    if state.silence > state.padding_frames:
+                        await self._emit(state, speaker)
+
     async def flush(self) -> None:
         """Emit any buffered segments."""
 
         for speaker, state in list(self._states.items()):
-            if state.triggered and state.frames:
+            if state.triggered and state.buffer:
                 await self._emit(state, speaker)
 
     # ------------------------------------------------------------------
@@ -104,15 +145,17 @@ class VoiceActivityDetector:
     async def _emit(self, state: _StreamState, speaker: Optional[str]) -> None:
         """Send the buffered segment to the callback, trimming padding."""
 
-        if state.silence >= state.padding_frames:
-            usable_frames = state.frames[: -state.padding_frames]
+        trim = 0
+        if state.padding_frames and state.silence >= state.padding_frames:
+            trim = state.padding_frames * state.frame_len
+        if trim and trim < len(state.buffer):
+            segment = bytes(memoryview(state.buffer)[:-trim])
         else:
-            usable_frames = state.frames
-        segment = b"".join(usable_frames)
+            segment = bytes(state.buffer)
 
         # Reset state before invoking callback to tolerate re‑entrancy
         state.triggered = False
-        state.frames.clear()
+        state.buffer.clear()
         state.silence = 0
 
         if self._segment_cb is None:
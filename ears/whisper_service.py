@@ -13,6 +13,7 @@ from __future__ import annotations
 import asyncio
 import math
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import AsyncIterator, Optional
 
@@ -20,6 +21,32 @@ import numpy as np
 from faster_whisper import WhisperModel
 import os
 
+def _detect_backend() -> tuple[str, str]:
+    """Pick the fastest device and compute type CTranslate2 supports here.
+
+    Prefers ``int8_float16`` on CUDA (int8 weights halve memory bandwidth,
+    the bottleneck at small batch sizes) and ``int8`` on CPU-only hosts. Falls
+    back to the historical CUDA/float16 pair when probing is impossible.
+    """
+
+    try:  # pragma: no cover - depends on installed backends
+        import ctranslate2
+
+        device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+        supported = set(ctranslate2.get_supported_compute_types(device))
+    except Exception:  # pragma: no cover - probing failed
+        return "cuda", "float16"
+    for compute_type in ("int8_float16", "float16", "int8"):
+        if compute_type in supported:
+            return device, compute_type
+    return device, "default"
+
+
+# Segments shorter than this (in samples at 16 kHz) skip the partial decoding
+# pass entirely: the final transcription of one second of audio lands before a
+# prefix decode would, so the extra encoder runs are pure redundant work.
+_PARTIAL_MIN_SAMPLES = 16000
+
 
 @dataclass
 class TranscriptionSegment:
@@ -42,22 +69,39 @@ class WhisperService:
     model_path:
         Path or name of the whisper model to load.
     device:
-        Device to run inference on. Defaults to ``"cuda"`` to enable GPU usage
-        when available.
+        Device to run inference on. Auto-detected via CTranslate2 when not
+        given: ``"cuda"`` if a GPU is visible, otherwise ``"cpu"``.
     compute_type:
-        Compute type for the CTranslate2 backend. ``"float16"`` offers a good
-        balance between speed and accuracy on modern GPUs.
+        Compute type for the CTranslate2 backend. Auto-detected when not
+        given: ``"int8_float16"`` on GPUs that support it (roughly 2x the
+        throughput of float16 at negligible accuracy cost), ``"int8"`` on
+        CPU-only hosts.
     """
 
     def __init__(
         self,
         model_path: Optional[str] = None,
         *,
-        device: str = "cuda",
-        compute_type: str = "float16",
+        device: Optional[str] = None,
+        compute_type: Optional[str] = None,
     ) -> None:
         model_path = model_path or os.getenv("WHISPER_MODEL", "small")
+        if device is None or compute_type is None:
+            detected_device, detected_compute = _detect_backend()
+            device = device or detected_device
+            compute_type = compute_type or detected_compute
         self._model = WhisperModel(model_path, device=device, compute_type=compute_type)
+        # Persistent worker pool shared by every transcribe call. Spawning two
+        # fresh threads per segment costs thread start-up on the hot path, and
+        # unbounded concurrent segments would contend for the single model;
+        # queueing them here runs the GPU calls back to back instead.
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="whisper")
+        # Reusable float32 buffer (30 s at 16 kHz) for the int16 -> float
+        # conversion, allocated on first use; the fused multiply in
+        # transcribe writes into it in one pass instead of allocating per
+        # segment and doing a cast plus a divide.
+        self._scratch = None
+        self._scratch_lock = threading.Lock()
 
     async def transcribe(self, pcm: bytes) -> AsyncIterator[TranscriptionSegment]:
         """Transcribe a buffer of 16‑bit mono PCM audio.
@@ -67,7 +111,29 @@ class WhisperService:
         are produced by the model.
         """
 
-        audio = np.frombuffer(pcm, dtype=np.int16).astype(np.float32) / 32768.0
+        samples = np.frombuffer(pcm, dtype=np.int16)
+        # Borrow the shared scratch buffer when it is free and large enough.
+        # The scratch path is pure optimisation: concurrent or oversized
+        # segments — or numpy substitutes without the primitives it needs —
+        # fall back to a private allocation.
+        audio = None
+        scratch_held = False
+        if self._scratch_lock.acquire(blocking=False):
+            try:
+                if self._scratch is None:
+                    self._scratch = np.empty(16000 * 30, dtype=np.float32)
+                if samples.size <= self._scratch.size:
+                    audio = self._scratch[: samples.size]
+                    np.multiply(samples, np.float32(1.0 / 32768.0), out=audio)
+                    scratch_held = True
+            except Exception:
+                audio = None
+            finally:
+                if not scratch_held:
+                    self._scratch_lock.release()
+        if audio is None:
+            audio = samples.astype(np.float32)
+            audio /= 32768.0
         loop = asyncio.get_running_loop()
         queue: asyncio.Queue[tuple[Optional[object], Optional[object], bool]] = asyncio.Queue()
         finished = threading.Event()
@@ -106,26 +172,32 @@ class WhisperService:
                 pos = next_pos
 
         # Start partial decoding before the full transcription to ensure
-        # early results are available even if the final pass is fast.
-        threading.Thread(target=_worker_partial, daemon=True).start()
-        threading.Thread(target=_worker_final, daemon=True).start()
-
-        while True:
-            seg, info, is_final = await queue.get()
-            if seg is None and is_final:
-                break
-            language = "" if info is None else info.language
-            lang_conf = 0.0 if info is None else info.language_probability
-            confidence = float(math.exp(getattr(seg, "avg_logprob", 0.0)))
-            yield TranscriptionSegment(
-                text=seg.text,
-                start=seg.start,
-                end=seg.end,
-                confidence=confidence,
-                language=language,
-                language_confidence=lang_conf,
-                is_final=is_final,
-            )
+        # early results are available even if the final pass is fast. Short
+        # segments go straight to the final pass.
+        if len(audio) >= _PARTIAL_MIN_SAMPLES:
+            self._executor.submit(_worker_partial)
+        self._executor.submit(_worker_final)
+
+        try:
+            while True:
+                seg, info, is_final = await queue.get()
+                if seg is None and is_final:
+                    break
+                language = "" if info is None else info.language
+                lang_conf = 0.0 if info is None else info.language_probability
+                confidence = float(math.exp(getattr(seg, "avg_logprob", 0.0)))
+                yield TranscriptionSegment(
+                    text=seg.text,
+                    start=seg.start,
+                    end=seg.end,
+                    confidence=confidence,
+                    language=language,
+                    language_confidence=lang_conf,
+                    is_final=is_final,
+                )
+        finally:
+            if scratch_held:
+                self._scratch_lock.release()
 
 
 __all__ = ["WhisperService", "TranscriptionSegment"]
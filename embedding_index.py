@@ -15,6 +15,8 @@ Examples
 >>> build_index(chunks, "embeddings.faiss", "meta.db")
 """
 
+import functools
+import os
 from pathlib import Path
 import sqlite3
 from typing import Iterable, Tuple, Dict, Any, List
@@ -23,28 +25,122 @@ import numpy as np
 
 DEFAULT_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
 
+#: Number of chunks embedded and written to the database per batch while
+#: building the index.
+BUILD_BATCH_SIZE = 1024
 
+
+@functools.lru_cache(maxsize=1)
+def _pick_device() -> str:
+    """Return ``"cuda"`` when a GPU is visible to torch, else ``"cpu"``."""
+
+    try:  # pragma: no cover - depends on installed backends
+        import torch
+
+        if torch.cuda.is_available():
+            return "cuda"
+    except Exception:
+        pass
+    return "cpu"
+
+
+@functools.lru_cache(maxsize=4)
 def _load_model(model_name: str):
-    """Load and return a :class:`SentenceTransformer` instance."""
+    """Load and return a :class:`SentenceTransformer` instance.
+
+    Instances are cached per model name: reloading MiniLM costs seconds of
+    disk and device transfer time, which used to dominate every
+    :func:`search_index` call.
+    """
 
     from sentence_transformers import SentenceTransformer
 
-    return SentenceTransformer(model_name)
+    return SentenceTransformer(model_name, device=_pick_device())
+
+
+@functools.lru_cache(maxsize=4)
+def _load_onnx_encoder(model_name: str):
+    """Return an ONNX Runtime ``(model, tokenizer)`` pair, or ``None``.
+
+    MiniLM-class models exported to ONNX run two to four times faster under
+    onnxruntime than under PyTorch. ``optimum`` and its dependencies are
+    optional; when they are missing or the export fails, callers fall back
+    to the sentence-transformers path.
+    """
+
+    try:  # pragma: no cover - optional dependency
+        from optimum.onnxruntime import ORTModelForFeatureExtraction
+        from transformers import AutoTokenizer
+
+        model = ORTModelForFeatureExtraction.from_pretrained(model_name, export=True)
+        tokenizer = AutoTokenizer.from_pretrained(model_name)
+    except Exception:  # pragma: no cover - handled at runtime
+        return None
+    return model, tokenizer
+
 
+def _encode_onnx(encoder, texts: list[str], batch_size: int) -> np.ndarray:
+    """Encode ``texts`` through the ONNX model with mean pooling.
 
-def embed_texts(texts: Iterable[str], model_name: str = DEFAULT_MODEL) -> np.ndarray:
+    Mirrors the sentence-transformers output: hidden states are mean-pooled
+    under the attention mask and L2-normalised.
+    """
+
+    model, tokenizer = encoder
+    pooled: list[np.ndarray] = []
+    for start in range(0, len(texts), batch_size):
+        batch = texts[start : start + batch_size]
+        enc = tokenizer(batch, padding=True, truncation=True, return_tensors="np")
+        hidden = np.asarray(model(**enc).last_hidden_state, dtype="float32")
+        mask = np.asarray(enc["attention_mask"], dtype="float32")[:, :, None]
+        pooled.append((hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None))
+    if not pooled:
+        return np.zeros((0, 0), dtype="float32")
+    embeddings = np.vstack(pooled)
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    np.clip(norms, 1e-12, None, out=norms)
+    return embeddings / norms
+
+
+def embed_texts(
+    texts: Iterable[str],
+    model_name: str = DEFAULT_MODEL,
+    batch_size: int | None = None,
+) -> np.ndarray:
     """Return embeddings for ``texts`` using ``model_name``.
 
-    Embeddings are returned as a NumPy ``float32`` array.
+    Embeddings are returned as a NumPy ``float32`` array in input order.
+    Texts are encoded sorted by length so each batch only pads to its own
+    longest member instead of the global maximum, then the rows are put back
+    in the callers' order. ``batch_size`` defaults to 128 on GPU and 32 on
+    CPU.
     """
 
-    model = _load_model(model_name)
-    vectors = model.encode(list(texts), show_progress_bar=False, normalize_embeddings=True)
-    return np.asarray(vectors, dtype="float32")
+    items = list(texts)
+    order = sorted(range(len(items)), key=lambda i: len(items[i]))
+    sorted_texts = [items[i] for i in order]
+    if batch_size is None:
+        batch_size = 128 if _pick_device() == "cuda" else 32
+    encoder = _load_onnx_encoder(model_name)
+    if encoder is not None:
+        embeddings = _encode_onnx(encoder, sorted_texts, batch_size)
+    else:
+        model = _load_model(model_name)
+        vectors = model.encode(
+            sorted_texts,
+            batch_size=batch_size,
+            show_progress_bar=False,
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+        )
+        embeddings = np.asarray(vectors, dtype="float32")
+    unsorted = np.empty_like(embeddings)
+    unsorted[order] = embeddings
+    return unsorted
 
 
 def _open_db(db_path: str | Path) -> sqlite3.Connection:
-    """Open ``db_path`` and ensure the metadata table exists."""
+    """Open ``db_path`` and ensure the metadata tables exist."""
 
     conn = sqlite3.connect(db_path)
     conn.execute(
@@ -57,9 +153,51 @@ def _open_db(db_path: str | Path) -> sqlite3.Connection:
         )
         """
     )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS index_info (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        )
+        """
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_metadata_path ON metadata(path)")
+    # WAL with NORMAL synchronisation turns the per-row fsyncs of the default
+    # journal mode into one group commit, which is what makes the batched
+    # inserts in build_index cheap.
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=268435456")
     return conn
 
 
+def _make_index(embeddings: np.ndarray) -> Tuple[Any, str]:
+    """Return an id-mapped FAISS index suited to ``embeddings`` and its type.
+
+    Embeddings are unit-normalised, so inner product ranks identically to L2
+    with one fewer operation per pair. Small corpora get an exact
+    ``IndexFlatIP``; above ten thousand vectors an ``IndexIVFPQ`` trades a
+    little recall for sub-linear search. The type string is recorded in the
+    metadata database so readers know which trade-off the index makes.
+    """
+
+    import faiss
+
+    n, d = embeddings.shape
+    if n > 10_000 and d % 16 == 0:
+        nlist = min(4096, n // 39)
+        base = faiss.IndexIVFPQ(
+            faiss.IndexFlatIP(d), d, nlist, 16, 8, faiss.METRIC_INNER_PRODUCT
+        )
+        base.train(embeddings)
+        base.nprobe = 8
+        # Keep per-id reconstruction working through the IVF structure.
+        base.set_direct_map_type(faiss.DirectMap.Array)
+        return faiss.IndexIDMap2(base), "ivfpq"
+    return faiss.IndexIDMap2(faiss.IndexFlatIP(d)), "flat_ip"
+
+
 def build_index(
     chunks: Iterable[Tuple[str, Dict[str, Any]]],
     index_path: str | Path,
@@ -79,47 +217,77 @@ def build_index(
         Destination path for the SQLite database storing metadata.
     model_name:
         Sentence-transformer model to use for embeddings.
+
+    Chunks are embedded and their metadata rows inserted in batches of
+    :data:`BUILD_BATCH_SIZE`, so the raw texts never need to be resident all
+    at once. Only the float32 embeddings are kept until the end, because
+    index training requires the full sample.
     """
 
     index_path = Path(index_path)
     db_path = Path(db_path)
 
-    texts: list[str] = []
-    meta: list[Dict[str, Any]] = []
-    for text, m in chunks:
-        texts.append(text)
-        meta.append(m)
-
-    if not texts:
-        raise ValueError("No chunks provided")
-
-    embeddings = embed_texts(texts, model_name)
-
-    import faiss
-
-    index = faiss.IndexIDMap(faiss.IndexFlatL2(embeddings.shape[1]))
-    ids = np.arange(len(embeddings), dtype="int64")
-    index.add_with_ids(embeddings, ids)
-    save_index(index, index_path)
-
-    conn = _open_db(db_path)
+    # Build against a temporary database and swap it in atomically at the
+    # end; a crash mid-build then leaves the previous database untouched
+    # instead of a half-populated one. save_index uses the same pattern for
+    # the FAISS file.
+    db_tmp = db_path.with_name(db_path.name + ".tmp")
+    db_tmp.unlink(missing_ok=True)
+    conn = _open_db(db_tmp)
     try:
-        rows = [
-            (
-                int(i),
-                m.get("path"),
-                ",".join(m.get("tags", [])),
-                ",".join(m.get("aliases", [])),
+        # One explicit transaction for the whole build; every batch insert
+        # lands in it and save_metadata() commits once at the end.
+        conn.execute("BEGIN")
+        embedded: list[np.ndarray] = []
+        batch_texts: list[str] = []
+        batch_meta: list[Dict[str, Any]] = []
+        total = 0
+
+        def _flush() -> None:
+            nonlocal total
+            if not batch_texts:
+                return
+            embedded.append(embed_texts(batch_texts, model_name))
+            rows = [
+                (
+                    total + i,
+                    m.get("path"),
+                    ",".join(m.get("tags", [])),
+                    ",".join(m.get("aliases", [])),
+                )
+                for i, m in enumerate(batch_meta)
+            ]
+            conn.executemany(
+                "INSERT OR REPLACE INTO metadata(chunk_id, path, tags, aliases) VALUES (?, ?, ?, ?)",
+                rows,
             )
-            for i, m in zip(ids, meta)
-        ]
-        conn.executemany(
-            "INSERT OR REPLACE INTO metadata(chunk_id, path, tags, aliases) VALUES (?, ?, ?, ?)",
-            rows,
+            total += len(batch_texts)
+            batch_texts.clear()
+            batch_meta.clear()
+
+        for text, m in chunks:
+            batch_texts.append(text)
+            batch_meta.append(m)
+            if len(batch_texts) == BUILD_BATCH_SIZE:
+                _flush()
+        _flush()
+
+        if not total:
+            raise ValueError("No chunks provided")
+
+        embeddings = embedded[0] if len(embedded) == 1 else np.vstack(embedded)
+        index, index_type = _make_index(embeddings)
+        index.add_with_ids(embeddings, np.arange(total, dtype="int64"))
+        save_index(index, index_path)
+
+        conn.execute(
+            "INSERT OR REPLACE INTO index_info(key, value) VALUES ('index_type', ?)",
+            (index_type,),
         )
         save_metadata(conn)
     finally:
         conn.close()
+    os.replace(db_tmp, db_path)
 
 
 def load_index(index_path: str | Path) -> Any:
@@ -131,11 +299,13 @@ def load_index(index_path: str | Path) -> Any:
 
 
 def save_index(index: Any, index_path: str | Path) -> None:
-    """Persist ``index`` to ``index_path``."""
+    """Persist ``index`` to ``index_path`` via an atomic rename."""
 
     import faiss
 
-    faiss.write_index(index, str(index_path))
+    tmp = f"{index_path}.tmp"
+    faiss.write_index(index, tmp)
+    os.replace(tmp, str(index_path))
 
 
 def load_metadata(db_path: str | Path) -> sqlite3.Connection:
@@ -197,6 +367,14 @@ def search_index(
             ).fetchall()
         else:
             rows = conn.execute("SELECT chunk_id FROM metadata").fetchall()
+        try:
+            info = conn.execute(
+                "SELECT value FROM index_info WHERE key = 'index_type'"
+            ).fetchone()
+            index_type = info[0] if info else None
+        except sqlite3.Error:
+            # Databases written before the index_info table existed.
+            index_type = None
     finally:
         conn.close()
 
@@ -205,8 +383,37 @@ def search_index(
 
     chunk_ids = [int(r[0]) for r in rows]
     index = faiss.read_index(str(index_path))
-    vectors = np.vstack([index.reconstruct(cid) for cid in chunk_ids])
-    diffs = vectors - query_vec
-    dists = np.sum(diffs * diffs, axis=1)
-    order = np.argsort(dists)[:top_k]
-    return [(chunk_ids[i], float(dists[i])) for i in order]
+    # Legacy index files built with IndexFlatL2 return squared distances
+    # from search directly; only inner-product scores need converting back
+    # to that format. Prefer the type recorded at build time, falling back
+    # to the metric the loaded index reports.
+    if index_type is not None:
+        is_ip = index_type in ("flat_ip", "ivfpq")
+    else:
+        is_ip = getattr(index, "metric_type", None) == getattr(
+            faiss, "METRIC_INNER_PRODUCT", 0
+        )
+    try:
+        params = None
+        if tags:
+            # Restrict the native search to the tag-filtered ids so FAISS's
+            # SIMD kernels do the scoring instead of a Python-side loop.
+            sel = faiss.IDSelectorBatch(np.asarray(chunk_ids, dtype="int64"))
+            params = faiss.SearchParameters(sel=sel)
+        scores, ids = index.search(
+            query_vec.reshape(1, -1), min(top_k, len(chunk_ids)), params=params
+        )
+        return [
+            (int(cid), float(2.0 - 2.0 * score if is_ip else score))
+            for cid, score in zip(ids[0], scores[0])
+            if cid != -1
+        ]
+    except Exception:
+        # Older FAISS builds without search-time ID selection: reconstruct
+        # the candidates and score them in one matrix-vector product.
+        # Unit-norm embeddings make ||x-y||^2 == 2 - 2*<x,y>, so both paths
+        # report the squared-L2 distance format callers sort by.
+        vectors = np.vstack([index.reconstruct(cid) for cid in chunk_ids])
+        dists = 2.0 - 2.0 * (vectors @ query_vec)
+        order = np.argsort(dists)[:top_k]
+        return [(chunk_ids[i], float(dists[i])) for i in order]
@@ -20,6 +20,8 @@ from notes.chunker import ensure_chunk_tables
 from notes.parser import parse_note, NoteParseError
 from brain.constants import DEFAULT_DREADHAVEN_ROOT, BANNED_TERMS
 import re
+import time
+from operator import itemgetter
 
 
 CHUNK_DB_NOT_READY_MESSAGE = (
@@ -29,6 +31,9 @@ CHUNK_DB_NOT_READY_MESSAGE = (
 
 _REQUIRED_CHUNK_TABLES = {"chunks", "tags"}
 
+# Upper bound for lore summaries surfaced in listings.
+LORE_SUMMARY_MAX_CHARS = 500
+
 
 def _paths() -> tuple[Path, Path, Path]:
     """Return `(vault, db_path, index_path)` for the campaign lore root.
@@ -176,7 +181,7 @@ def search(query: str, tags: List[str] | None = None) -> List[Dict[str, Any]]:
                                 break
                         if not heading:
                             heading = p.stem
-                        para = raw.strip().split("\n\n", 1)[0]
+                        para = raw.strip().partition("\n\n")[0]
                         results.append(
                             {
                                 "path": str(p.relative_to(root)),
@@ -216,7 +221,7 @@ def search(query: str, tags: List[str] | None = None) -> List[Dict[str, Any]]:
                     if not heading:
                         heading = path.stem
                     # Content: first paragraph
-                    para = raw.strip().split("\n\n", 1)[0]
+                    para = raw.strip().partition("\n\n")[0]
                     results.append(
                         {
                             "path": str(path.relative_to(root)),
@@ -293,18 +298,50 @@ def create_note(path: str, text: str) -> Path:
             fh.write(entry)
     else:
         note_path.write_text(entry.lstrip(), encoding="utf-8")
+    invalidate_npc_cache()
     return note_path
 
 
+# Cached ``list_npcs`` results keyed by the chunks database that produced
+# them: ``(expires_at, db_path, db_mtime_ns, results)``. NPC listings are
+# requested on every bot command but the underlying notes change rarely.
+NPC_CACHE_TTL = 30.0  # seconds
+_npc_cache: tuple[float, Path, int, List[Dict[str, Any]]] | None = None
+# Lowercased name/alias -> NPC mapping rebuilt whenever the cache refreshes.
+_npc_alias_map: Dict[str, Dict[str, Any]] = {}
+# Bounded, pre-joined alias preview for "unknown NPC" replies. Capped so a
+# large vault cannot turn the failure branch into a multi-KB string build
+# per miss.
+NPC_ALIAS_PREVIEW_LIMIT = 50
+_npc_aliases_preview = ""
+
+
 def list_npcs() -> List[Dict[str, Any]]:
     """Return metadata for all notes tagged ``#npc``.
 
     The chunk database is queried for any notes containing an ``npc`` tag and
-    each matching note is parsed to extract its metadata.
+    each matching note is parsed to extract its metadata. Results are cached
+    for a short interval (and invalidated when the chunks database changes)
+    so repeated commands do not rescan the vault.
     """
 
+    global _npc_cache, _npc_alias_map, _npc_aliases_preview
+
     vault, db_path, _ = _paths()
     _ensure_chunks_db_ready(db_path)
+
+    try:
+        db_mtime = db_path.stat().st_mtime_ns
+    except OSError:
+        db_mtime = -1
+    cached = _npc_cache
+    if (
+        cached is not None
+        and cached[1] == db_path
+        and cached[2] == db_mtime
+        and time.monotonic() < cached[0]
+    ):
+        return list(cached[3])
     conn = sqlite3.connect(db_path)
     try:
         ensure_chunk_tables(conn)
@@ -337,7 +374,66 @@ def list_npcs() -> List[Dict[str, Any]]:
                 "metadata": metadata,
             }
         )
-    return results
+    # Same decorate-sort as list_lore: one casefold per NPC, C-level key
+    # extraction, and a stable alphabetical listing cached for the TTL.
+    keyed = [
+        (str(npc.get("name") or (npc.get("aliases") or [""])[0] or npc["path"]).casefold(), npc)
+        for npc in results
+    ]
+    keyed.sort(key=itemgetter(0))
+    results = [npc for _, npc in keyed]
+    _npc_cache = (time.monotonic() + NPC_CACHE_TTL, db_path, db_mtime, results)
+    _npc_alias_map = _build_alias_map(results)
+    _npc_aliases_preview = ", ".join(sorted(_npc_alias_map)[:NPC_ALIAS_PREVIEW_LIMIT])
+    return list(results)
+
+
+def _build_alias_map(npcs: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Map casefolded names and aliases onto their NPC entries."""
+
+    mapping: Dict[str, Dict[str, Any]] = {}
+    for npc in npcs:
+        keys = list(npc.get("aliases") or [])
+        name = npc.get("name")
+        if name:
+            keys.append(str(name))
+        for key in keys:
+            mapping.setdefault(str(key).casefold(), npc)
+    return mapping
+
+
+def find_npc(name: str) -> Dict[str, Any] | None:
+    """Return the NPC whose name or alias matches ``name``.
+
+    Matching is case-insensitive and resolved through a prebuilt alias
+    mapping instead of scanning every NPC's alias list per lookup.
+    """
+
+    list_npcs()  # refresh the cache (and alias map) if needed
+    return _npc_alias_map.get(name.strip().casefold())
+
+
+def invalidate_npc_cache() -> None:
+    """Drop the cached NPC listing so the next lookup rescans the vault.
+
+    Called after vault writes such as :func:`create_note`; the TTL alone
+    would otherwise serve stale listings for up to :data:`NPC_CACHE_TTL`
+    seconds.
+    """
+
+    global _npc_cache
+    _npc_cache = None
+
+
+def npc_aliases_preview() -> str:
+    """Return a capped, sorted preview of known NPC names and aliases.
+
+    Precomputed once per cache refresh so callers can show it in "unknown
+    NPC" replies without rejoining every alias on each miss.
+    """
+
+    list_npcs()
+    return _npc_aliases_preview
 
 
 def list_lore() -> List[Dict[str, Any]]:
@@ -375,13 +471,12 @@ def list_lore() -> List[Dict[str, Any]]:
         title = parsed.aliases[0] if parsed.aliases else Path(rel_path).stem
         summary = ""
         if parsed.text:
-            paragraphs = [p.strip() for p in parsed.text.split("\n\n") if p.strip()]
-            if paragraphs:
-                summary = paragraphs[0]
-            else:
-                lines = [ln.strip() for ln in parsed.text.splitlines() if ln.strip()]
-                if lines:
-                    summary = lines[0]
+            # Take only the leading paragraph instead of splitting the whole
+            # body, and cap it so listings stay bounded for huge notes.
+            text = parsed.text.strip()
+            summary = text.partition("\n\n")[0].strip()
+            if len(summary) > LORE_SUMMARY_MAX_CHARS:
+                summary = summary[:LORE_SUMMARY_MAX_CHARS].rstrip() + "…"
 
         results.append(
             {
@@ -395,5 +490,9 @@ def list_lore() -> List[Dict[str, Any]]:
             }
         )
 
-    return results
+    # Decorate-sort: casefold each title exactly once instead of inside the
+    # comparison key, then present entries in a stable, readable order.
+    keyed = [(entry["title"].casefold(), entry) for entry in results]
+    keyed.sort(key=itemgetter(0))
+    return [entry for _, entry in keyed]
 
@@ -8,6 +8,23 @@ import requests
 from ears.transcript_logger import TranscriptLogger
 import service_api
 
+# Default combat tracker endpoint, resolved once at import instead of on
+# every export call.
+DEFAULT_COMBAT_URL = os.getenv("COMBAT_TRACKER_URL", "http://localhost:8000")
+
+# Reused HTTP session so repeated exports keep the tracker connection alive.
+_session = None
+
+
+def _http_get(url: str, timeout: float):
+    global _session
+    session_cls = getattr(requests, "Session", None)
+    if session_cls is None:
+        return requests.get(url, timeout=timeout)
+    if _session is None:
+        _session = session_cls()
+    return _session.get(url, timeout=timeout)
+
 
 def export_session(transcript_root: str | Path | None = None,
                    combat_url: str | None = None) -> Path:
@@ -30,21 +47,25 @@ def export_session(transcript_root: str | Path | None = None,
         The path to the created note within the vault.
     """
 
-    combat_url = combat_url or os.getenv("COMBAT_TRACKER_URL", "http://localhost:8000")
-    resp = requests.get(f"{combat_url}/events", timeout=10)
+    combat_url = combat_url or DEFAULT_COMBAT_URL
+    resp = _http_get(f"{combat_url}/events", timeout=10)
     resp.raise_for_status()
     events = resp.json()
 
     transcript_root = Path(transcript_root or os.getenv("TRANSCRIPT_ROOT", "transcripts"))
     logger = TranscriptLogger(transcript_root)
-    session_id = logger.rotate()
-
-    summaries: list[tuple[str, str]] = []
-    for file in transcript_root.glob(f"*.{session_id}.jsonl"):
-        channel = file.stem.split(".")[0]
-        summary = logger.summary(channel, session_id)
-        if summary:
-            summaries.append((channel, summary))
+    try:
+        session_id = logger.rotate()
+
+        summaries: list[tuple[str, str]] = []
+        for file in transcript_root.glob(f"*.{session_id}.jsonl"):
+            channel = file.stem.split(".")[0]
+            summary = logger.summary(channel, session_id)
+            if summary:
+                summaries.append((channel, summary))
+    finally:
+        # Per-call logger; release its flush thread and descriptors.
+        logger.close()
 
     lines: list[str] = ["## Combat"]
     if events:
@@ -44,7 +44,7 @@ def test_load_permissions(tmp_path):
     discord_config.PERMISSIONS_FILE = cfg
     discord_config._RULE_CACHE = None
     rules = discord_config.get_permission_rules()
-    assert rules == {"npc": {"channels": [1], "roles": [2]}}
+    assert rules == {"npc": {"channels": frozenset({1}), "roles": frozenset({2})}}
 
 
 def test_permission_check(tmp_path):
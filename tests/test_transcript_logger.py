@@ -19,6 +19,7 @@ def test_append_and_summary(tmp_path):
     logger = TranscriptLogger(tmp_path)
     logger.append("chan", "alice", "hello", language="en", confidence=0.9)
     logger.append("chan", "bob", "hi", language="en", confidence=0.8)
+    logger.flush()
 
     path = tmp_path / "chan.jsonl"
     entries = read_jsonl(path)
@@ -36,7 +36,8 @@ def test_diarizer_splits_speakers() -> None:
 
     state = _StreamState(0)
     state.triggered = True
-    state.frames.append(segment)
+    state.buffer += segment
+    state.frame_len = len(segment)
 
     asyncio.run(vad._emit(state, None))
 